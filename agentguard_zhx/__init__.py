@@ -4,21 +4,58 @@ AgentGuard Python SDK
 A Python SDK for integrating with AgentGuard - AI Agent governance and monitoring platform.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.0.4"
 
-from .client import AgentGuardOpenAI
-from .config import AgentGuardConfig
-from .interceptors.requests_interceptor import enable_agentguard
-from .approvals import ApprovalStatus, ApprovalStatusResponse
-from .tools import AgentGuardTools
-from .http import AgentGuardHTTP
+if TYPE_CHECKING:
+    from .client import AgentGuardOpenAI, AsyncAgentGuardOpenAI
+    from .config import AgentGuardConfig
+    from .interceptors.requests_interceptor import enable_agentguard
+    from .approvals import ApprovalClient, ApprovalStatus, ApprovalStatusResponse
+    from .tools import AgentGuardTools
+    from .http import AgentGuardHTTP, AsyncAgentGuardHTTP
+
+# Public name -> defining module. Submodules (and openai/httpx/requests with
+# them) are imported on first attribute access (PEP 562), so e.g.
+# `from agentguard_zhx import enable_agentguard` doesn't load the OpenAI SDK.
+_LAZY_ATTRS = {
+    "AgentGuardOpenAI": ".client",
+    "AsyncAgentGuardOpenAI": ".client",
+    "AgentGuardConfig": ".config",
+    "enable_agentguard": ".interceptors.requests_interceptor",
+    "ApprovalClient": ".approvals",
+    "ApprovalStatus": ".approvals",
+    "ApprovalStatusResponse": ".approvals",
+    "AgentGuardTools": ".tools",
+    "AgentGuardHTTP": ".http",
+    "AsyncAgentGuardHTTP": ".http",
+}
 
-__all__ = [
+__all__ = (
     "AgentGuardOpenAI",
+    "AsyncAgentGuardOpenAI",
     "AgentGuardConfig",
     "enable_agentguard",
+    "ApprovalClient",
     "ApprovalStatus",
     "ApprovalStatusResponse",
     "AgentGuardTools",
     "AgentGuardHTTP",
-]
+    "AsyncAgentGuardHTTP",
+)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
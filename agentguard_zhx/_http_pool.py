@@ -0,0 +1,78 @@
+"""Process-wide pooled httpx clients shared by AgentGuard SDK objects
+
+Short-lived ApprovalClient / AgentGuardHTTP instances talking to the same
+AgentGuard server share one connection pool, so TLS handshakes are amortized
+across unrelated call sites. Clients are created lazily and closed at
+interpreter exit; a forked child starts with an empty registry instead of
+reusing the parent's sockets.
+"""
+
+import atexit
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0
+)
+
+_shared_clients: Dict[Tuple, httpx.Client] = {}
+_lock = threading.Lock()
+
+
+def _close_shared_clients() -> None:
+    for client in list(_shared_clients.values()):
+        client.close()
+
+
+def _reset_after_fork() -> None:
+    global _lock
+    # The parent's clients hold its connections (and HTTP/2 state); drop them
+    # without closing, and replace the lock in case another thread held it
+    _shared_clients.clear()
+    _lock = threading.Lock()
+
+
+atexit.register(_close_shared_clients)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_shared_client(
+    base_url: str,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = True
+) -> httpx.Client:
+    """
+    Get the process-wide pooled client for an AgentGuard server.
+
+    Args:
+        base_url: AgentGuard server URL, used as the client's base_url
+        limits: Connection pool limits (default: DEFAULT_LIMITS)
+        http2: Whether to enable HTTP/2
+
+    Returns:
+        Shared httpx.Client. Callers must not close it; it is closed at exit.
+    """
+    limits = limits or DEFAULT_LIMITS
+    key = (
+        base_url.rstrip('/'),
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+    )
+
+    client = _shared_clients.get(key)
+    if client is None:
+        with _lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = httpx.Client(base_url=base_url, limits=limits, http2=http2)
+                _shared_clients[key] = client
+    return client
@@ -0,0 +1,37 @@
+"""JSON helpers backed by orjson when available, falling back to the stdlib"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+
+def _stdlib_dumps(obj, indent: bool = False) -> bytes:
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the stdlib exception
+    JSONDecodeError = orjson.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes (compact, or indented by 2)."""
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            # orjson rejects values the stdlib accepts (integers beyond 64
+            # bits, for one); the stdlib raises TypeError if it can't either
+            return _stdlib_dumps(obj, indent)
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+    dumps = _stdlib_dumps
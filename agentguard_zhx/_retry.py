@@ -0,0 +1,129 @@
+"""Retry helpers with jittered exponential backoff for AgentGuard HTTP calls"""
+
+import asyncio
+import random
+import time
+from typing import Optional
+
+import httpx
+
+
+# Status codes that indicate a transient condition worth retrying
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Status codes / errors that guarantee the request was not processed, so even
+# non-idempotent requests can be retried safely
+_UNPROCESSED_STATUS_CODES = frozenset({429, 503})
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _backoff_delay(
+    attempt: int,
+    backoff_base: float,
+    backoff_cap: float,
+    response: Optional[httpx.Response] = None
+) -> float:
+    """
+    Compute the delay before the next attempt.
+
+    Honors a ``Retry-After`` header (in seconds, capped at ``backoff_cap`` so
+    a misbehaving server can't stall the caller indefinitely) when present,
+    otherwise uses full-jitter exponential backoff so that many clients polling the same
+    server don't retry in lockstep.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(0.0, float(retry_after)), backoff_cap)
+            except ValueError:
+                pass
+    return random.uniform(0, min(backoff_cap, backoff_base * 2 ** attempt))
+
+
+def _should_retry_status(response: httpx.Response, idempotent: bool) -> bool:
+    if idempotent:
+        return response.status_code in RETRY_STATUS_CODES
+    return response.status_code in _UNPROCESSED_STATUS_CODES
+
+
+def _should_retry_error(error: httpx.RequestError, idempotent: bool) -> bool:
+    return idempotent or isinstance(error, _UNSENT_ERRORS)
+
+
+def send_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    retries: int,
+    backoff_base: float,
+    backoff_cap: float,
+    idempotent: bool = True,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send a request, retrying transient failures.
+
+    Args:
+        client: httpx client to send the request with
+        method: HTTP method
+        url: Request URL
+        retries: Maximum number of retries after the first attempt
+        backoff_base: Base delay in seconds for exponential backoff
+        backoff_cap: Maximum delay in seconds between attempts
+        idempotent: Whether the request may be replayed after it reached the
+            server. When False, only failures that guarantee the request was
+            not processed are retried.
+        **kwargs: Additional arguments passed to ``client.request``
+
+    Returns:
+        The last response received
+
+    Raises:
+        httpx.RequestError: If the request still fails after all retries
+    """
+    attempt = 0
+    while True:
+        try:
+            response = client.request(method, url, **kwargs)
+        except httpx.RequestError as e:
+            if attempt >= retries or not _should_retry_error(e, idempotent):
+                raise
+            delay = _backoff_delay(attempt, backoff_base, backoff_cap)
+        else:
+            if attempt >= retries or not _should_retry_status(response, idempotent):
+                return response
+            delay = _backoff_delay(attempt, backoff_base, backoff_cap, response)
+            response.close()
+
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_send_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    retries: int,
+    backoff_base: float,
+    backoff_cap: float,
+    idempotent: bool = True,
+    **kwargs
+) -> httpx.Response:
+    """Async counterpart of :func:`send_with_retry`."""
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.RequestError as e:
+            if attempt >= retries or not _should_retry_error(e, idempotent):
+                raise
+            delay = _backoff_delay(attempt, backoff_base, backoff_cap)
+        else:
+            if attempt >= retries or not _should_retry_status(response, idempotent):
+                return response
+            delay = _backoff_delay(attempt, backoff_base, backoff_cap, response)
+            await response.aclose()
+
+        await asyncio.sleep(delay)
+        attempt += 1
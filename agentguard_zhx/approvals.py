@@ -1,11 +1,28 @@
 """AgentGuard Approval API client"""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import threading
+import time
+from types import MappingProxyType
 import httpx
 from enum import Enum
 
+from . import _json
 from .config import AgentGuardConfig
 from .exceptions import AgentGuardError
+from ._http_pool import get_shared_client
+from ._retry import send_with_retry
+
+
+# Terminal approval states never change, so they can be cached for a long time
+_TERMINAL_STATUS_TTL = 3600.0
+_STATUS_CACHE_MAX_SIZE = 10000
+
+# Shared read-only stand-in for a missing or null "data" payload
+_EMPTY = MappingProxyType({})
 
 
 class ApprovalStatus(str, Enum):
@@ -16,38 +33,68 @@ class ApprovalStatus(str, Enum):
     EXPIRED = "EXPIRED"
 
 
+# Raw API value -> ApprovalStatus, avoiding Enum's value lookup machinery
+_STATUS_MAP = {s.value: s for s in ApprovalStatus}
+
+
+@dataclass(frozen=True, repr=False)
 class ApprovalStatusResponse:
-    """Approval status query response"""
+    """
+    Approval status query response.
 
-    def __init__(self, status: str, execution_result: Optional[Any] = None, remark: Optional[str] = None):
-        self.status = ApprovalStatus(status)
-        self.execution_result = execution_result
-        self.remark = remark
+    Instances are immutable; the ``is_*`` flags are computed once at
+    construction, so checking them in a polling loop is a plain attribute read.
+    """
 
-    @property
-    def is_pending(self) -> bool:
-        """Check if approval is still pending"""
-        return self.status == ApprovalStatus.PENDING
+    status: ApprovalStatus
+    execution_result: Optional[Any] = None
+    remark: Optional[str] = None
+    is_pending: bool = field(init=False, compare=False)
+    is_approved: bool = field(init=False, compare=False)
+    is_rejected: bool = field(init=False, compare=False)
+    is_expired: bool = field(init=False, compare=False)
 
-    @property
-    def is_approved(self) -> bool:
-        """Check if approval was approved"""
-        return self.status == ApprovalStatus.APPROVED
+    def __post_init__(self):
+        try:
+            status = _STATUS_MAP[self.status]
+        except KeyError:
+            raise AgentGuardError(f"Unknown approval status: {self.status!r}") from None
+        # Frozen dataclass: assign derived fields through object.__setattr__
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "is_pending", status is ApprovalStatus.PENDING)
+        object.__setattr__(self, "is_approved", status is ApprovalStatus.APPROVED)
+        object.__setattr__(self, "is_rejected", status is ApprovalStatus.REJECTED)
+        object.__setattr__(self, "is_expired", status is ApprovalStatus.EXPIRED)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "ApprovalStatusResponse":
+        """
+        Build a response from the ``data`` payload of the status API.
 
-    @property
-    def is_rejected(self) -> bool:
-        """Check if approval was rejected"""
-        return self.status == ApprovalStatus.REJECTED
+        Args:
+            data: Status payload with ``status``, ``executionResult`` and ``remark``
 
-    @property
-    def is_expired(self) -> bool:
-        """Check if approval has expired"""
-        return self.status == ApprovalStatus.EXPIRED
+        Returns:
+            ApprovalStatusResponse
+        """
+        return cls(
+            status=data.get("status"),
+            execution_result=data.get("executionResult"),
+            remark=data.get("remark")
+        )
 
     def __repr__(self) -> str:
         return f"ApprovalStatusResponse(status={self.status.value})"
 
 
+def _is_settled(status: ApprovalStatusResponse) -> bool:
+    # An approved request whose execution hasn't finished yet will still
+    # gain an execution_result, so only treat it as final once it has one
+    return not status.is_pending and not (
+        status.is_approved and status.execution_result is None
+    )
+
+
 class ApprovalClient:
     """
     Client for querying approval status.
@@ -75,7 +122,12 @@ class ApprovalClient:
         agentguard_url: Optional[str] = None,
         agent_api_key: Optional[str] = None,
         config: Optional[AgentGuardConfig] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        retries: int = 4,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0,
+        status_ttl: float = 2.0,
+        http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize approval client.
@@ -85,6 +137,17 @@ class ApprovalClient:
             agent_api_key: AgentGuard API key
             config: AgentGuardConfig object (alternative to individual params)
             timeout: Request timeout in seconds
+            retries: Maximum number of retries for transient failures
+                (connection errors, 429/502/503/504)
+            backoff_base: Base delay in seconds for jittered exponential backoff
+            backoff_cap: Maximum delay in seconds between retries
+            status_ttl: Seconds a PENDING status is served from cache before
+                querying the server again. Final statuses (REJECTED, EXPIRED,
+                or APPROVED with an execution result) are cached for an hour
+                since they never change.
+            http_client: httpx.Client to send requests with instead of the
+                process-wide shared pool. Its base_url must be the AgentGuard
+                server URL. The caller remains responsible for closing it.
         """
         if config:
             self.config = config
@@ -96,15 +159,91 @@ class ApprovalClient:
         else:
             self.config = AgentGuardConfig.from_env()
 
-        self.config.validate()
         self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.status_ttl = status_ttl
+
+        # approval_id -> (expires_at, ApprovalStatusResponse), oldest first
+        self._status_cache = OrderedDict()
+        self._status_cache_lock = threading.Lock()
+
+        self._auth_headers = {"X-Agent-API-Key": self.config.agent_api_key}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+
+        # Use the given client, or the process-wide pool for this AgentGuard
+        # server, so even short-lived clients reuse warm connections
+        if http_client is not None:
+            self._client = http_client
+        else:
+            self._client = get_shared_client(self.config.agentguard_url)
+
+    def close(self) -> None:
+        """
+        Release the client.
+
+        The connection pool is shared (process-wide, or supplied via
+        ``http_client``) and is therefore left open; the process-wide pool is
+        closed automatically at interpreter exit.
+        """
+
+    def __enter__(self) -> "ApprovalClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request to AgentGuard, retrying transient failures with backoff."""
+        return send_with_retry(
+            self._client,
+            method,
+            url,
+            retries=self.retries,
+            backoff_base=self.backoff_base,
+            backoff_cap=self.backoff_cap,
+            timeout=self.timeout,
+            **kwargs
+        )
+
+    def invalidate(self, approval_id: str) -> None:
+        """
+        Drop the cached status of an approval so the next query hits the server.
 
-    def get_status(self, approval_id: str) -> ApprovalStatusResponse:
+        Args:
+            approval_id: The approval ID
+        """
+        with self._status_cache_lock:
+            self._status_cache.pop(approval_id, None)
+
+    def _get_cached_status(self, approval_id: str) -> Optional[ApprovalStatusResponse]:
+        with self._status_cache_lock:
+            entry = self._status_cache.get(approval_id)
+            if entry is None:
+                return None
+            expires_at, status = entry
+            if time.monotonic() >= expires_at:
+                del self._status_cache[approval_id]
+                return None
+            return status
+
+    def _cache_status(self, approval_id: str, status: ApprovalStatusResponse) -> None:
+        ttl = _TERMINAL_STATUS_TTL if _is_settled(status) else self.status_ttl
+        with self._status_cache_lock:
+            self._status_cache[approval_id] = (time.monotonic() + ttl, status)
+            self._status_cache.move_to_end(approval_id)
+            while len(self._status_cache) > _STATUS_CACHE_MAX_SIZE:
+                self._status_cache.popitem(last=False)
+
+    def get_status(self, approval_id: str, cache: bool = True) -> ApprovalStatusResponse:
         """
         Query approval status by ID.
 
         Args:
             approval_id: The approval ID returned when approval was triggered
+            cache: Whether a recently fetched status may be returned instead of
+                querying the server (see ``status_ttl``)
 
         Returns:
             ApprovalStatusResponse with status, execution_result (if approved), or remark (if rejected)
@@ -112,29 +251,30 @@ class ApprovalClient:
         Raises:
             AgentGuardError: If the request fails
         """
-        url = f"{self.config.agentguard_url}/api/v1/approvals/{approval_id}/status"
-        headers = {
-            "X-Agent-API-Key": self.config.agent_api_key
-        }
+        if cache:
+            cached = self._get_cached_status(approval_id)
+            if cached is not None:
+                return cached
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-
-                result = response.json()
-                if result.get("code") != 200:
-                    raise AgentGuardError(
-                        f"Failed to query approval status: {result.get('message', 'Unknown error')}"
-                    )
-
-                data = result.get("data", {})
-                return ApprovalStatusResponse(
-                    status=data.get("status"),
-                    execution_result=data.get("executionResult"),
-                    remark=data.get("remark")
+            response = self._request_with_retry(
+                "GET",
+                f"/api/v1/approvals/{approval_id}/status",
+                headers=self._auth_headers
+            )
+            response.raise_for_status()
+
+            result = _json.loads(response.content)
+            if result.get("code") != 200:
+                raise AgentGuardError(
+                    f"Failed to query approval status: {result.get('message', 'Unknown error')}"
                 )
 
+            data = result.get("data") or _EMPTY
+            status = ApprovalStatusResponse.from_api(data)
+            self._cache_status(approval_id, status)
+            return status
+
         except httpx.HTTPStatusError as e:
             raise AgentGuardError(f"HTTP error querying approval status: {e}")
         except httpx.RequestError as e:
@@ -142,6 +282,74 @@ class ApprovalClient:
         except Exception as e:
             raise AgentGuardError(f"Unexpected error querying approval status: {e}")
 
+    def wait_for_approval(
+        self,
+        approval_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 2.0
+    ) -> ApprovalStatusResponse:
+        """
+        Block until an approval is settled.
+
+        Polls the status API over the client's pooled keep-alive connection,
+        so no inbound webhook endpoint is needed. An approval is settled once
+        it is rejected or expired, or approved with an execution result.
+
+        Args:
+            approval_id: The approval ID returned when approval was triggered
+            timeout: Maximum number of seconds to wait (default: wait forever)
+            poll_interval: Seconds between status queries
+
+        Returns:
+            The settled ApprovalStatusResponse, or the latest unsettled one if
+            the timeout expired first
+
+        Raises:
+            AgentGuardError: If a request fails
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.get_status(approval_id, cache=False)
+            if _is_settled(status):
+                return status
+
+            delay = poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return status
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def get_statuses(
+        self,
+        approval_ids: List[str],
+        max_workers: int = 16
+    ) -> Dict[str, ApprovalStatusResponse]:
+        """
+        Query the status of several approvals concurrently.
+
+        Requests run in a thread pool over the client's shared connection
+        pool, so N lookups take roughly one round trip instead of N.
+
+        Args:
+            approval_ids: Approval IDs to query
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dict mapping each approval ID to its ApprovalStatusResponse
+
+        Raises:
+            AgentGuardError: If any of the requests fails
+        """
+        unique_ids = list(dict.fromkeys(approval_ids))
+        if not unique_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            statuses = executor.map(self.get_status, unique_ids)
+            return dict(zip(unique_ids, statuses))
+
     def submit_reason(self, approval_id: str, reason: str) -> Dict[str, Any]:
         """
         Submit approval reason/justification.
@@ -156,27 +364,25 @@ class ApprovalClient:
         Raises:
             AgentGuardError: If the request fails
         """
-        url = f"{self.config.agentguard_url}/api/v1/approvals/{approval_id}/reason"
-        headers = {
-            "X-Agent-API-Key": self.config.agent_api_key,
-            "Content-Type": "application/json"
-        }
-
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(url, headers=headers, json={"reason": reason})
-                response.raise_for_status()
-
-                result = response.json()
-                if result.get("code") != 200:
-                    raise AgentGuardError(
-                        f"Failed to submit approval reason: {result.get('message', 'Unknown error')}"
-                    )
-
-                return {
-                    "success": True,
-                    "message": "Approval reason submitted successfully"
-                }
+            response = self._request_with_retry(
+                "POST",
+                f"/api/v1/approvals/{approval_id}/reason",
+                headers=self._json_headers,
+                content=_json.dumps({"reason": reason})
+            )
+            response.raise_for_status()
+
+            result = _json.loads(response.content)
+            if result.get("code") != 200:
+                raise AgentGuardError(
+                    f"Failed to submit approval reason: {result.get('message', 'Unknown error')}"
+                )
+
+            return {
+                "success": True,
+                "message": "Approval reason submitted successfully"
+            }
 
         except httpx.HTTPStatusError as e:
             raise AgentGuardError(f"HTTP error submitting approval reason: {e}")
@@ -2,14 +2,113 @@
 
 from typing import Optional
 import httpx
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .config import AgentGuardConfig
-from .interceptors.httpx_interceptor import AgentGuardTransport
+from .interceptors.httpx_interceptor import AgentGuardTransport, AsyncAgentGuardTransport
 from .approvals import ApprovalClient
 
 
-class AgentGuardOpenAI(OpenAI):
+class _AgentGuardClientMixin:
+    """Approval management and tool helpers shared by sync/async OpenAI wrappers"""
+
+    @property
+    def approvals(self) -> ApprovalClient:
+        """
+        Access approval management functionality.
+
+        Returns:
+            ApprovalClient instance for managing approvals
+
+        Example:
+            >>> client = AgentGuardOpenAI(...)
+            >>> # Query approval status
+            >>> status = client.approvals.get_status("approval_id")
+            >>> if status.is_approved:
+            ...     print("Approved:", status.execution_result)
+            >>>
+            >>> # Submit approval reason
+            >>> client.approvals.submit_reason("approval_id", "Need to delete test data")
+        """
+        return self._approvals
+
+    def merge_tools(self, business_tools: list) -> list:
+        """
+        Merge business tools with AgentGuard approval tools.
+
+        This is a convenience method that automatically adds AgentGuard's
+        approval management tools to your business tools list.
+
+        Args:
+            business_tools: List of business tool definitions
+
+        Returns:
+            Merged list of tools (business + AgentGuard approval tools)
+
+        Example:
+            >>> client = AgentGuardOpenAI(...)
+            >>>
+            >>> # Define your business tools
+            >>> business_tools = [
+            ...     {
+            ...         "type": "function",
+            ...         "function": {
+            ...             "name": "get_weather",
+            ...             "description": "Get weather info",
+            ...             "parameters": {...}
+            ...         }
+            ...     }
+            ... ]
+            >>>
+            >>> # Automatically merge with AgentGuard tools
+            >>> all_tools = client.merge_tools(business_tools)
+            >>>
+            >>> # Use in chat completion
+            >>> response = client.chat.completions.create(
+            ...     model="gpt-4",
+            ...     messages=[...],
+            ...     tools=all_tools  # Includes approval tools automatically
+            ... )
+        """
+        return business_tools + self._tools_helper.get_tool_definitions()
+
+    def get_function_map(self, business_functions: dict) -> dict:
+        """
+        Merge business functions with AgentGuard approval functions.
+
+        This is a convenience method that automatically adds AgentGuard's
+        approval management functions to your business functions dictionary.
+
+        Args:
+            business_functions: Dictionary of business function implementations
+
+        Returns:
+            Merged dictionary of functions (business + AgentGuard approval functions)
+
+        Example:
+            >>> client = AgentGuardOpenAI(...)
+            >>>
+            >>> # Define your business functions
+            >>> business_functions = {
+            ...     "get_weather": get_weather_func,
+            ...     "send_email": send_email_func
+            ... }
+            >>>
+            >>> # Automatically merge with AgentGuard functions
+            >>> all_functions = client.get_function_map(business_functions)
+            >>>
+            >>> # Execute tool calls
+            >>> for tool_call in message.tool_calls:
+            ...     func = all_functions[tool_call.function.name]
+            ...     result = func(**args)
+        """
+        return {
+            **business_functions,
+            **self._tools_helper.get_function_map()
+        }
+
+
+class AgentGuardOpenAI(_AgentGuardClientMixin, OpenAI):
     """
     AgentGuard wrapper for OpenAI client with integrated approval management.
 
@@ -42,6 +141,9 @@ class AgentGuardOpenAI(OpenAI):
         agent_api_key: Optional[str] = None,
         config: Optional[AgentGuardConfig] = None,
         timeout: float = 600.0,  # 默认 600 秒，与 OpenAI SDK 保持一致
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        propagate_original_url: bool = True,
         **kwargs
     ):
         """
@@ -52,6 +154,10 @@ class AgentGuardOpenAI(OpenAI):
             agent_api_key: AgentGuard API key
             config: AgentGuardConfig object (alternative to individual params)
             timeout: Request timeout in seconds (default: 600s, same as OpenAI SDK)
+            max_connections: Maximum number of concurrent connections to AgentGuard
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            propagate_original_url: Whether to send the original request URL to
+                AgentGuard in the X-Original-URL header
             **kwargs: Additional arguments passed to OpenAI client
         """
         # Load configuration
@@ -65,8 +171,6 @@ class AgentGuardOpenAI(OpenAI):
         else:
             self.config = AgentGuardConfig.from_env()
 
-        self.config.validate()
-
         # Create custom HTTP client with AgentGuard transport and timeout
         # 使用与 OpenAI SDK 相同的超时配置：
         # - connect: 5s (连接超时)
@@ -80,12 +184,18 @@ class AgentGuardOpenAI(OpenAI):
             pool=timeout
         )
 
+        # 传入自定义 transport 时 httpx.Client 会忽略 limits/http2 参数，
+        # 因此连接池与协议配置需要交给 transport（默认启用 HTTP/2）
+        transport = AgentGuardTransport(
+            agentguard_url=self.config.agentguard_url,
+            agent_api_key=self.config.agent_api_key,
+            timeout=timeout,  # 传递超时参数到 transport
+            propagate_original_url=propagate_original_url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
         http_client = httpx.Client(
-            transport=AgentGuardTransport(
-                agentguard_url=self.config.agentguard_url,
-                agent_api_key=self.config.agent_api_key,
-                timeout=timeout  # 传递超时参数到 transport
-            ),
+            transport=transport,
             timeout=timeout_config  # 使用详细的超时配置
         )
 
@@ -98,103 +208,119 @@ class AgentGuardOpenAI(OpenAI):
         )
 
         # Initialize integrated approval client
-        self._approvals = ApprovalClient(config=self.config)
+        # 审批接口与 LLM 请求发往同一个 AgentGuard 地址，直接复用上面的连接池，
+        # 只是不经过请求改写
+        self._approvals = ApprovalClient(
+            config=self.config,
+            http_client=httpx.Client(
+                base_url=self.config.agentguard_url,
+                transport=transport.passthrough(),
+                timeout=30.0
+            )
+        )
 
         # Initialize tools helper for automatic tool merging
         from .tools import AgentGuardTools
         self._tools_helper = AgentGuardTools(self)
 
-    @property
-    def approvals(self) -> ApprovalClient:
-        """
-        Access approval management functionality.
 
-        Returns:
-            ApprovalClient instance for managing approvals
+class AsyncAgentGuardOpenAI(_AgentGuardClientMixin, AsyncOpenAI):
+    """
+    Async AgentGuard wrapper for OpenAI client with integrated approval management.
 
-        Example:
-            >>> client = AgentGuardOpenAI(...)
-            >>> # Query approval status
-            >>> status = client.approvals.get_status("approval_id")
-            >>> if status.is_approved:
-            ...     print("Approved:", status.execution_result)
-            >>>
-            >>> # Submit approval reason
-            >>> client.approvals.submit_reason("approval_id", "Need to delete test data")
-        """
-        return self._approvals
+    Async counterpart of AgentGuardOpenAI, built on ``openai.AsyncOpenAI``. All
+    requests go through one HTTP/2 connection pool to AgentGuard, so concurrent
+    calls are multiplexed instead of each opening its own connection.
 
-    def merge_tools(self, business_tools: list) -> list:
-        """
-        Merge business tools with AgentGuard approval tools.
+    Example:
+        >>> import asyncio
+        >>> from agentguard import AsyncAgentGuardOpenAI
+        >>>
+        >>> client = AsyncAgentGuardOpenAI(
+        ...     agentguard_url="http://localhost:8080",
+        ...     agent_api_key="ag_xxx"
+        ... )
+        >>>
+        >>> async def main():
+        ...     return await asyncio.gather(*[
+        ...         client.chat.completions.create(
+        ...             model="gpt-4",
+        ...             messages=[{"role": "user", "content": question}]
+        ...         )
+        ...         for question in ("Hello", "How are you?")
+        ...     ])
+        >>>
+        >>> responses = asyncio.run(main())
+    """
 
-        This is a convenience method that automatically adds AgentGuard's
-        approval management tools to your business tools list.
+    def __init__(
+        self,
+        agentguard_url: Optional[str] = None,
+        agent_api_key: Optional[str] = None,
+        config: Optional[AgentGuardConfig] = None,
+        timeout: float = 600.0,  # 默认 600 秒，与 OpenAI SDK 保持一致
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        propagate_original_url: bool = True,
+        **kwargs
+    ):
+        """
+        Initialize async AgentGuard OpenAI client.
 
         Args:
-            business_tools: List of business tool definitions
-
-        Returns:
-            Merged list of tools (business + AgentGuard approval tools)
-
-        Example:
-            >>> client = AgentGuardOpenAI(...)
-            >>>
-            >>> # Define your business tools
-            >>> business_tools = [
-            ...     {
-            ...         "type": "function",
-            ...         "function": {
-            ...             "name": "get_weather",
-            ...             "description": "Get weather info",
-            ...             "parameters": {...}
-            ...         }
-            ...     }
-            ... ]
-            >>>
-            >>> # Automatically merge with AgentGuard tools
-            >>> all_tools = client.merge_tools(business_tools)
-            >>>
-            >>> # Use in chat completion
-            >>> response = client.chat.completions.create(
-            ...     model="gpt-4",
-            ...     messages=[...],
-            ...     tools=all_tools  # Includes approval tools automatically
-            ... )
+            agentguard_url: AgentGuard server URL
+            agent_api_key: AgentGuard API key
+            config: AgentGuardConfig object (alternative to individual params)
+            timeout: Request timeout in seconds (default: 600s, same as OpenAI SDK)
+            max_connections: Maximum number of concurrent connections to AgentGuard
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            propagate_original_url: Whether to send the original request URL to
+                AgentGuard in the X-Original-URL header
+            **kwargs: Additional arguments passed to AsyncOpenAI client
         """
-        return business_tools + self._tools_helper.get_tool_definitions()
+        # Load configuration
+        if config:
+            self.config = config
+        elif agentguard_url and agent_api_key:
+            self.config = AgentGuardConfig(
+                agentguard_url=agentguard_url,
+                agent_api_key=agent_api_key
+            )
+        else:
+            self.config = AgentGuardConfig.from_env()
 
-    def get_function_map(self, business_functions: dict) -> dict:
-        """
-        Merge business functions with AgentGuard approval functions.
+        # 超时与连接池配置与同步客户端保持一致
+        timeout_config = httpx.Timeout(
+            connect=5.0,
+            read=timeout,
+            write=timeout,
+            pool=timeout
+        )
 
-        This is a convenience method that automatically adds AgentGuard's
-        approval management functions to your business functions dictionary.
+        # transport 默认启用 HTTP/2，使并发请求复用同一条到 AgentGuard 的连接
+        http_client = httpx.AsyncClient(
+            transport=AsyncAgentGuardTransport(
+                agentguard_url=self.config.agentguard_url,
+                agent_api_key=self.config.agent_api_key,
+                timeout=timeout,
+                propagate_original_url=propagate_original_url,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=timeout_config
+        )
 
-        Args:
-            business_functions: Dictionary of business function implementations
+        # Initialize AsyncOpenAI client with custom settings
+        super().__init__(
+            api_key=self.config.agent_api_key,
+            base_url=f"{self.config.agentguard_url}/proxy/v1",
+            http_client=http_client,
+            **kwargs
+        )
 
-        Returns:
-            Merged dictionary of functions (business + AgentGuard approval functions)
+        # Initialize integrated approval client
+        self._approvals = ApprovalClient(config=self.config)
 
-        Example:
-            >>> client = AgentGuardOpenAI(...)
-            >>>
-            >>> # Define your business functions
-            >>> business_functions = {
-            ...     "get_weather": get_weather_func,
-            ...     "send_email": send_email_func
-            ... }
-            >>>
-            >>> # Automatically merge with AgentGuard functions
-            >>> all_functions = client.get_function_map(business_functions)
-            >>>
-            >>> # Execute tool calls
-            >>> for tool_call in message.tool_calls:
-            ...     func = all_functions[tool_call.function.name]
-            ...     result = func(**args)
-        """
-        return {
-            **business_functions,
-            **self._tools_helper.get_function_map()
-        }
+        # Initialize tools helper for automatic tool merging
+        from .tools import AgentGuardTools
+        self._tools_helper = AgentGuardTools(self)
@@ -1,13 +1,14 @@
 """Configuration management for AgentGuard SDK"""
 
+import functools
 import os
 from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentGuardConfig:
-    """AgentGuard configuration"""
+    """AgentGuard configuration (immutable, validated on construction)"""
 
     agentguard_url: str
     agent_api_key: str
@@ -15,8 +16,15 @@ class AgentGuardConfig:
     webhook_secret: Optional[str] = None
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "AgentGuardConfig":
-        """Create configuration from environment variables"""
+        """
+        Create configuration from environment variables.
+
+        The result is cached, so every client built from the environment in
+        this process shares one config. Call ``AgentGuardConfig.from_env.cache_clear()``
+        after changing the environment to pick up new values.
+        """
         return cls(
             agentguard_url=os.getenv("AGENTGUARD_URL", "http://localhost:8080"),
             agent_api_key=os.getenv("AGENTGUARD_API_KEY", ""),
@@ -24,6 +32,9 @@ class AgentGuardConfig:
             webhook_secret=os.getenv("AGENTGUARD_WEBHOOK_SECRET"),
         )
 
+    def __post_init__(self):
+        self.validate()
+
     def validate(self) -> None:
         """Validate configuration"""
         if not self.agentguard_url:
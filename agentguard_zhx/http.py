@@ -6,12 +6,130 @@ through AgentGuard's business API proxy for governance and monitoring.
 
 import httpx
 from typing import Optional, Dict, Any, Union
+from urllib.parse import urlencode
 import json
 
+from . import _json
 from .config import AgentGuardConfig
+from ._http_pool import get_shared_client
+from ._retry import async_send_with_retry, send_with_retry
 
 
-class AgentGuardHTTP:
+# Target methods that are safe to replay if a proxied call fails mid-flight
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _handle_pending_approval(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Operation requires approval: surface the approval request ID."""
+    return {
+        "status": "PENDING_APPROVAL",
+        "approvalRequestId": data.get("approvalRequestId"),
+        "message": "This operation requires approval"
+    }
+
+
+def _handle_success(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Operation succeeded: return the target API's response."""
+    return data["response"] if "response" in data else data
+
+
+# Proxy result status -> handler producing the value returned to the caller
+_RESPONSE_STATUS_HANDLERS = {
+    "PENDING_APPROVAL": _handle_pending_approval,
+    "SUCCESS": _handle_success,
+}
+
+
+class _BaseAgentGuardHTTP:
+    """Shared configuration and proxy envelope handling for sync/async clients"""
+
+    def __init__(
+        self,
+        agentguard_url: Optional[str] = None,
+        agent_api_key: Optional[str] = None,
+        config: Optional[AgentGuardConfig] = None,
+        timeout: float = 30.0,
+        retries: int = 4,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0
+    ):
+        """
+        Initialize AgentGuard HTTP client.
+
+        Args:
+            agentguard_url: AgentGuard server URL
+            agent_api_key: AgentGuard API key
+            config: AgentGuardConfig object (alternative to individual params)
+            timeout: Request timeout in seconds
+            retries: Maximum number of retries for transient failures
+                (connection errors, 429/502/503/504)
+            backoff_base: Base delay in seconds for jittered exponential backoff
+            backoff_cap: Maximum delay in seconds between retries
+        """
+        if config:
+            self.config = config
+        elif agentguard_url and agent_api_key:
+            self.config = AgentGuardConfig(
+                agentguard_url=agentguard_url,
+                agent_api_key=agent_api_key
+            )
+        else:
+            self.config = AgentGuardConfig.from_env()
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.proxy_url = f"{self.config.agentguard_url}/proxy/v1/api"
+        self._default_headers = {"Content-Type": "application/json"}
+
+    def _build_proxy_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Build the envelope sent to the AgentGuard business API proxy."""
+        # Construct proxy request
+        proxy_request = {
+            "apiKey": self.config.agent_api_key,
+            "targetUrl": url,
+            "method": method.upper(),
+            "headers": headers or self._default_headers
+        }
+
+        # Add query parameters to URL if provided
+        if params:
+            separator = "&" if "?" in url else "?"
+            proxy_request["targetUrl"] = f"{url}{separator}{urlencode(params, doseq=True)}"
+
+        # Add body if provided
+        if json is not None:
+            proxy_request["body"] = json
+        elif data is not None:
+            proxy_request["body"] = data
+
+        return proxy_request
+
+    def _parse_proxy_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Unwrap the AgentGuard proxy response envelope."""
+        # Check if request was successful
+        if result.get("code") == 200 and "data" in result:
+            data = result["data"]
+            handler = _RESPONSE_STATUS_HANDLERS.get(data.get("status"))
+            return handler(data) if handler else data
+
+        # Return error response
+        return {
+            "error": result.get("message", "Unknown error"),
+            "code": result.get("code")
+        }
+
+
+class AgentGuardHTTP(_BaseAgentGuardHTTP):
     """
     HTTP client that routes all requests through AgentGuard business API proxy.
 
@@ -44,7 +162,11 @@ class AgentGuardHTTP:
         agentguard_url: Optional[str] = None,
         agent_api_key: Optional[str] = None,
         config: Optional[AgentGuardConfig] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        retries: int = 4,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0,
+        http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize AgentGuard HTTP client.
@@ -54,20 +176,53 @@ class AgentGuardHTTP:
             agent_api_key: AgentGuard API key
             config: AgentGuardConfig object (alternative to individual params)
             timeout: Request timeout in seconds
+            retries: Maximum number of retries for transient failures
+                (connection errors, 429/502/503/504)
+            backoff_base: Base delay in seconds for jittered exponential backoff
+            backoff_cap: Maximum delay in seconds between retries
+            http_client: httpx.Client to send requests with instead of the
+                process-wide shared pool. The caller remains responsible for
+                closing it.
         """
-        if config:
-            self.config = config
-        elif agentguard_url and agent_api_key:
-            self.config = AgentGuardConfig(
-                agentguard_url=agentguard_url,
-                agent_api_key=agent_api_key
-            )
+        super().__init__(
+            agentguard_url, agent_api_key, config, timeout,
+            retries, backoff_base, backoff_cap
+        )
+
+        # Use the given client, or the process-wide pool for this AgentGuard
+        # server, so bursts of proxied calls reuse keep-alive connections
+        if http_client is not None:
+            self._client = http_client
         else:
-            self.config = AgentGuardConfig.from_env()
+            self._client = get_shared_client(self.config.agentguard_url)
 
-        self.config.validate()
-        self.timeout = timeout
-        self.proxy_url = f"{self.config.agentguard_url}/proxy/v1/api"
+    def close(self) -> None:
+        """
+        Release the client.
+
+        The connection pool is shared (process-wide, or supplied via
+        ``http_client``) and is therefore left open; the process-wide pool is
+        closed automatically at interpreter exit.
+        """
+
+    def __enter__(self) -> "AgentGuardHTTP":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request to AgentGuard, retrying transient failures with backoff."""
+        return send_with_retry(
+            self._client,
+            method,
+            url,
+            retries=self.retries,
+            backoff_base=self.backoff_base,
+            backoff_cap=self.backoff_cap,
+            timeout=self.timeout,
+            **kwargs
+        )
 
     def request(
         self,
@@ -95,59 +250,19 @@ class AgentGuardHTTP:
         Raises:
             Exception: If the request fails
         """
-        # Construct proxy request
-        proxy_request = {
-            "apiKey": self.config.agent_api_key,
-            "targetUrl": url,
-            "method": method.upper(),
-            "headers": headers or {"Content-Type": "application/json"}
-        }
-
-        # Add query parameters to URL if provided
-        if params:
-            query_string = "&".join(f"{k}={v}" for k, v in params.items())
-            proxy_request["targetUrl"] = f"{url}?{query_string}"
-
-        # Add body if provided
-        if json is not None:
-            proxy_request["body"] = json
-        elif data is not None:
-            proxy_request["body"] = data
+        proxy_request = self._build_proxy_request(method, url, headers, json, data, params)
 
         # Send request to AgentGuard proxy
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                self.proxy_url,
-                json=proxy_request
-            )
-            response.raise_for_status()
-
-            # Parse AgentGuard response
-            result = response.json()
-
-            # Check if request was successful
-            if result.get("code") == 200 and "data" in result:
-                data = result["data"]
-
-                # Check if operation requires approval
-                if data.get("status") == "PENDING_APPROVAL":
-                    return {
-                        "status": "PENDING_APPROVAL",
-                        "approvalRequestId": data.get("approvalRequestId"),
-                        "message": "This operation requires approval"
-                    }
-
-                # Return successful response
-                if data.get("status") == "SUCCESS" and "response" in data:
-                    return data["response"]
-
-                return data
+        response = self._request_with_retry(
+            "POST",
+            self.proxy_url,
+            idempotent=method.upper() in _IDEMPOTENT_METHODS,
+            content=_json.dumps(proxy_request),
+            headers=self._default_headers
+        )
+        response.raise_for_status()
 
-            # Return error response
-            return {
-                "error": result.get("message", "Unknown error"),
-                "code": result.get("code")
-            }
+        return self._parse_proxy_response(_json.loads(response.content))
 
     def get(self, url: str, **kwargs) -> Dict[str, Any]:
         """Make a GET request."""
@@ -168,3 +283,148 @@ class AgentGuardHTTP:
     def patch(self, url: str, **kwargs) -> Dict[str, Any]:
         """Make a PATCH request."""
         return self.request("PATCH", url, **kwargs)
+
+
+class AsyncAgentGuardHTTP(_BaseAgentGuardHTTP):
+    """
+    Async HTTP client that routes all requests through AgentGuard business API proxy.
+
+    Backed by a single HTTP/2 ``httpx.AsyncClient``, so many concurrent requests
+    are multiplexed over one connection to AgentGuard.
+
+    Example:
+        >>> import asyncio
+        >>> from agentguard import AsyncAgentGuardHTTP
+        >>>
+        >>> async def main():
+        ...     async with AsyncAgentGuardHTTP(
+        ...         agentguard_url="http://localhost:8080",
+        ...         agent_api_key="ag_xxx"
+        ...     ) as http:
+        ...         return await asyncio.gather(
+        ...             http.get("https://api.example.com/users/1"),
+        ...             http.get("https://api.example.com/users/2"),
+        ...         )
+        >>>
+        >>> results = asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        agentguard_url: Optional[str] = None,
+        agent_api_key: Optional[str] = None,
+        config: Optional[AgentGuardConfig] = None,
+        timeout: float = 30.0,
+        retries: int = 4,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 8.0
+    ):
+        """
+        Initialize async AgentGuard HTTP client.
+
+        Args:
+            agentguard_url: AgentGuard server URL
+            agent_api_key: AgentGuard API key
+            config: AgentGuardConfig object (alternative to individual params)
+            timeout: Request timeout in seconds
+            retries: Maximum number of retries for transient failures
+                (connection errors, 429/502/503/504)
+            backoff_base: Base delay in seconds for jittered exponential backoff
+            backoff_cap: Maximum delay in seconds between retries
+        """
+        super().__init__(
+            agentguard_url, agent_api_key, config, timeout,
+            retries, backoff_base, backoff_cap
+        )
+
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=100,
+                keepalive_expiry=60.0
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncAgentGuardHTTP":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request to AgentGuard, retrying transient failures with backoff."""
+        return await async_send_with_retry(
+            self._client,
+            method,
+            url,
+            retries=self.retries,
+            backoff_base=self.backoff_base,
+            backoff_cap=self.backoff_cap,
+            **kwargs
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        params: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request through AgentGuard proxy.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            url: Target URL to call
+            headers: Optional request headers
+            json: Optional JSON body
+            data: Optional raw body data
+            params: Optional query parameters
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            Exception: If the request fails
+        """
+        proxy_request = self._build_proxy_request(method, url, headers, json, data, params)
+
+        # Send request to AgentGuard proxy
+        response = await self._request_with_retry(
+            "POST",
+            self.proxy_url,
+            idempotent=method.upper() in _IDEMPOTENT_METHODS,
+            content=_json.dumps(proxy_request),
+            headers=self._default_headers
+        )
+        response.raise_for_status()
+
+        return self._parse_proxy_response(_json.loads(response.content))
+
+    async def get(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make a PUT request."""
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make a DELETE request."""
+        return await self.request("DELETE", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Make a PATCH request."""
+        return await self.request("PATCH", url, **kwargs)
@@ -1,6 +1,37 @@
 """Interceptors package"""
 
-from .httpx_interceptor import AgentGuardTransport
-from .requests_interceptor import enable_agentguard
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["AgentGuardTransport", "enable_agentguard"]
+if TYPE_CHECKING:
+    from .httpx_interceptor import AgentGuardTransport, AsyncAgentGuardTransport
+    from .requests_interceptor import AgentGuardAdapter, enable_agentguard
+
+# Loaded on first access, so using one interceptor doesn't import the other's
+# HTTP library
+_LAZY_ATTRS = {
+    "AgentGuardTransport": ".httpx_interceptor",
+    "AsyncAgentGuardTransport": ".httpx_interceptor",
+    "AgentGuardAdapter": ".requests_interceptor",
+    "enable_agentguard": ".requests_interceptor",
+}
+
+__all__ = [
+    "AgentGuardTransport",
+    "AsyncAgentGuardTransport",
+    "AgentGuardAdapter",
+    "enable_agentguard",
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
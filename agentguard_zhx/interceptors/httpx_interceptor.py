@@ -4,14 +4,16 @@ import httpx
 import json
 from typing import Optional
 
+from .. import _json
 
-class AgentGuardTransport(httpx.HTTPTransport):
-    """
-    Custom HTTPX transport that routes requests through AgentGuard proxy.
 
-    This transport intercepts all HTTP requests and modifies them to go through
-    the AgentGuard proxy server for governance and monitoring.
-    """
+_SSE_TOKEN = b'text/event-stream'
+_NDJSON_TOKEN = b'application/x-ndjson'
+_JSON_TOKEN = b'json'
+
+
+class _AgentGuardTransportMixin:
+    """Request rewriting and response unwrapping shared by sync/async transports"""
 
     def __init__(
         self,
@@ -19,78 +21,112 @@ class AgentGuardTransport(httpx.HTTPTransport):
         agent_api_key: str,
         timeout: float = 600.0,
         *args,
+        propagate_original_url: bool = True,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
         **kwargs
     ):
         """
         Initialize AgentGuard transport.
 
+        All traffic goes to the single AgentGuard host, so one small pool of
+        warm connections serves every request; the defaults are sized for that
+        rather than httpx's generic 100/20 limits.
+
         Args:
             agentguard_url: AgentGuard server URL
             agent_api_key: AgentGuard API key
             timeout: Request timeout in seconds (default: 600s, same as OpenAI SDK)
+            propagate_original_url: Whether to send the original request URL to
+                AgentGuard in the X-Original-URL header
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Whether to multiplex requests over HTTP/2
+            **kwargs: Additional arguments passed to the httpx transport
+                (an explicit ``limits`` overrides the pool settings above)
         """
-        super().__init__(*args, **kwargs)
+        kwargs.setdefault("limits", httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ))
+        super().__init__(*args, http2=http2, **kwargs)
         self.agentguard_url = agentguard_url.rstrip('/')
         self.agent_api_key = agent_api_key
         self.timeout = int(timeout)  # 转换为整数（秒）
+        self.propagate_original_url = propagate_original_url
+        # 代理地址固定不变，构造时解析一次，避免每个请求重复解析 URL
+        self._proxy_url = httpx.URL(f"{self.agentguard_url}/proxy/v1/chat/completions")
 
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
+    def _prepare_request(self, request: httpx.Request) -> httpx.Request:
         """
-        Handle HTTP request by routing through AgentGuard.
+        Rewrite the original request so it targets the AgentGuard proxy.
 
         Args:
             request: Original HTTP request
 
         Returns:
-            HTTP response from AgentGuard proxy (unwrapped to standard OpenAI format)
+            Request addressed to the AgentGuard proxy
         """
-        # Store original URL and request for reference
-        original_url = str(request.url)
-        original_request = request
+        # Store original URL for reference (skipped entirely when not propagated)
+        original_url = str(request.url) if self.propagate_original_url else None
 
         # Parse request body and add timeout parameter
         if request.content:
             try:
-                body = json.loads(request.content)
+                body = _json.loads(request.content)
                 # Add timeout to request body for AgentGuard backend
                 body['timeout'] = self.timeout
                 # Create new request with updated content
-                new_content = json.dumps(body).encode('utf-8')
+                new_content = _json.dumps(body)
 
-                # Copy headers, remove Content-Length to avoid conflicts
-                new_headers = {}
-                for key, value in request.headers.items():
-                    if key.lower() != 'content-length':
-                        new_headers[key] = value
+                # Copy headers (case-insensitive, so assignments below replace
+                # existing values instead of duplicating them)
+                new_headers = request.headers.copy()
 
                 # Add/update required headers (keep existing Authorization from OpenAI SDK)
-                new_headers["X-Original-URL"] = original_url
                 new_headers["Content-Length"] = str(len(new_content))
                 new_headers["Content-Type"] = "application/json"
 
                 # Create a new request with updated content and headers
                 request = httpx.Request(
                     method=request.method,
-                    url=f"{self.agentguard_url}/proxy/v1/chat/completions",
+                    url=self._proxy_url,
                     headers=new_headers,
                     content=new_content
                 )
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, KeyError, TypeError):
                 # If parsing fails, continue without adding timeout
-                request.url = httpx.URL(f"{self.agentguard_url}/proxy/v1/chat/completions")
-                request.headers["X-Original-URL"] = original_url
+                request.url = self._proxy_url
         else:
-            # No content, just update URL and headers
-            request.url = httpx.URL(f"{self.agentguard_url}/proxy/v1/chat/completions")
+            # No content, just update URL
+            request.url = self._proxy_url
+
+        if original_url is not None:
             request.headers["X-Original-URL"] = original_url
 
-        # Execute the request through parent transport
-        response = super().handle_request(request)
+        return request
 
-        # Unwrap AgentGuard response format to standard OpenAI format
-        response = self._unwrap_agentguard_response(response, original_request)
+    def _is_streaming_response(self, response: httpx.Response) -> bool:
+        """Check whether the proxy response must be passed through unbuffered."""
+        # 直接扫描原始 header 字节，避免构造 str 再 lower()
+        content_type = b''
+        chunked = False
+        for name, value in response.headers.raw:
+            name = name.lower()
+            if name == b'content-type':
+                content_type = value.lower()
+            elif name == b'transfer-encoding':
+                chunked = b'chunked' in value.lower()
 
-        return response
+        if _SSE_TOKEN in content_type or _NDJSON_TOKEN in content_type:
+            return True
+        # AgentGuard 的包装响应本身也可能以 chunked 返回 JSON，需要缓冲后解包；
+        # 其余 chunked 响应不会被解包，直接流式透传
+        return chunked and _JSON_TOKEN not in content_type
 
     def _unwrap_agentguard_response(self, response: httpx.Response, original_request: httpx.Request) -> httpx.Response:
         """
@@ -99,8 +135,9 @@ class AgentGuardTransport(httpx.HTTPTransport):
         AgentGuard wraps responses in: {"code": 200, "data": {"response": {...}}}
         This method extracts the actual OpenAI response from data.response
 
-        For streaming responses (text/event-stream), returns the response as-is
-        to preserve streaming behavior.
+        For streaming responses (text/event-stream, application/x-ndjson, or
+        chunked non-JSON bodies), returns the response as-is to preserve
+        streaming behavior.
 
         Args:
             response: AgentGuard wrapped response
@@ -111,18 +148,17 @@ class AgentGuardTransport(httpx.HTTPTransport):
         """
         try:
             # Check if this is a streaming response
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/event-stream' in content_type:
+            if self._is_streaming_response(response):
                 # For streaming responses, return as-is to preserve streaming
                 return response
 
             # For non-streaming responses, unwrap the AgentGuard format
             # Read response content if not already read
-            if not hasattr(response, '_content'):
+            if not response.is_stream_consumed:
                 response.read()
 
             # Parse response body
-            body = json.loads(response.content)
+            body = _json.loads(response.content)
 
             # Check if this is an AgentGuard wrapped response
             if isinstance(body, dict) and 'data' in body and 'response' in body['data']:
@@ -133,7 +169,7 @@ class AgentGuardTransport(httpx.HTTPTransport):
                 unwrapped_response = httpx.Response(
                     status_code=response.status_code,
                     headers=response.headers,
-                    content=json.dumps(actual_response).encode('utf-8')
+                    content=_json.dumps(actual_response)
                 )
                 # Set the request manually
                 unwrapped_response._request = original_request
@@ -147,3 +183,90 @@ class AgentGuardTransport(httpx.HTTPTransport):
             # If parsing fails, return original response
             return response
 
+
+class _PassthroughTransport(httpx.BaseTransport):
+    """Sends requests unmodified over an AgentGuardTransport's connection pool"""
+
+    def __init__(self, transport: "AgentGuardTransport"):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.HTTPTransport.handle_request(self._transport, request)
+
+    def close(self) -> None:
+        # The connection pool is owned (and closed) by the wrapped transport
+        pass
+
+
+class AgentGuardTransport(_AgentGuardTransportMixin, httpx.HTTPTransport):
+    """
+    Custom HTTPX transport that routes requests through AgentGuard proxy.
+
+    This transport intercepts all HTTP requests and modifies them to go through
+    the AgentGuard proxy server for governance and monitoring.
+    """
+
+    def passthrough(self) -> httpx.BaseTransport:
+        """
+        Get a transport that shares this transport's connection pool but sends
+        requests as-is, e.g. for calling AgentGuard's own APIs.
+
+        Returns:
+            Transport backed by the same connection pool
+        """
+        return _PassthroughTransport(self)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Handle HTTP request by routing through AgentGuard.
+
+        Args:
+            request: Original HTTP request
+
+        Returns:
+            HTTP response from AgentGuard proxy (unwrapped to standard OpenAI format)
+        """
+        original_request = request
+        request = self._prepare_request(request)
+
+        # Execute the request through parent transport
+        response = super().handle_request(request)
+
+        # Unwrap AgentGuard response format to standard OpenAI format
+        response = self._unwrap_agentguard_response(response, original_request)
+
+        return response
+
+
+class AsyncAgentGuardTransport(_AgentGuardTransportMixin, httpx.AsyncHTTPTransport):
+    """
+    Async HTTPX transport that routes requests through AgentGuard proxy.
+
+    Async counterpart of AgentGuardTransport, used by AsyncAgentGuardOpenAI.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Handle HTTP request by routing through AgentGuard.
+
+        Args:
+            request: Original HTTP request
+
+        Returns:
+            HTTP response from AgentGuard proxy (unwrapped to standard OpenAI format)
+        """
+        original_request = request
+        request = self._prepare_request(request)
+
+        # Execute the request through parent transport
+        response = await super().handle_async_request(request)
+
+        # The body of an async response can only be read asynchronously,
+        # so buffer it here before unwrapping (streams are left untouched)
+        if not self._is_streaming_response(response):
+            await response.aread()
+
+        # Unwrap AgentGuard response format to standard OpenAI format
+        response = self._unwrap_agentguard_response(response, original_request)
+
+        return response
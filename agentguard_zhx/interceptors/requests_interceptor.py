@@ -1,15 +1,176 @@
 """Requests library interceptor for AgentGuard"""
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 import json
-from functools import wraps
-from typing import Optional, List, Pattern
+from functools import lru_cache, wraps
+from typing import Any, Callable, List, Mapping, Optional, Pattern, Tuple
 import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .. import _json
+from ..exceptions import AgentGuardError, ConfigurationError
 
 
 # Store original request function
 _original_request = requests.request
 
+_REGEX_META = frozenset('.^$*+?{}[]|()')
+
+# Headers describing the connection to (or the encoding of the body sent to)
+# the original host; they don't apply to the request the proxy will make
+_HOP_BY_HOP_HEADERS = frozenset({
+    'connection',
+    'content-length',
+    'host',
+    'keep-alive',
+    'proxy-connection',
+    'te',
+    'trailer',
+    'transfer-encoding',
+    'upgrade',
+})
+
+
+def _regex_compiler(engine: str) -> Callable[[str], Pattern]:
+    """
+    Get the compile function of a regex engine.
+
+    Args:
+        engine: Regex engine, "re" (stdlib) or "re2" (google-re2, linear-time
+            matching that rules out catastrophic backtracking)
+
+    Returns:
+        The engine's ``compile`` function
+
+    Raises:
+        ConfigurationError: If the engine is unknown or not installed
+    """
+    if engine == "re":
+        return re.compile
+    if engine == "re2":
+        try:
+            import re2
+        except ImportError:
+            raise ConfigurationError(
+                "intercept_engine='re2' requires the google-re2 package "
+                "(pip install agentguard-zhx[re2])"
+            ) from None
+        return re2.compile
+    raise ConfigurationError(f"Unknown intercept_engine: {engine!r}")
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...], engine: str = "re") -> Optional[Pattern]:
+    """
+    Compile URL patterns into a single alternation regex, where that's safe.
+
+    Cached on the pattern tuple and engine, so re-enabling interception with
+    the same patterns reuses the compiled regex. Joining changes the meaning
+    of patterns with capture groups (backreference numbers shift across
+    branches) and of patterns with inline global flags such as ``(?i)``
+    (rejected anywhere but the start), so those are left uncombined.
+
+    Args:
+        patterns: URL patterns to intercept (regex)
+        engine: Regex engine, "re" or "re2" (see ``_regex_compiler``)
+
+    Returns:
+        Combined regex, or None if there are no patterns or they can't be
+        combined safely
+
+    Raises:
+        ConfigurationError: If the engine is unknown or not installed
+    """
+    compile_ = _regex_compiler(engine)
+    if not patterns:
+        return None
+    if any(compile_(pattern).groups for pattern in patterns):
+        return None
+    try:
+        return compile_("|".join(f"(?:{pattern})" for pattern in patterns))
+    except Exception:
+        # Each pattern compiles on its own, so the join itself is at fault
+        # (re.error / re2.error for misplaced inline flags)
+        return None
+
+
+_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@lru_cache(maxsize=None)
+def _request_duration_histogram():
+    """
+    Get the Prometheus histogram for intercepted request durations.
+
+    Created once per process, since prometheus_client rejects registering the
+    same metric name twice.
+
+    Raises:
+        ConfigurationError: If prometheus_client is not installed
+    """
+    try:
+        from prometheus_client import Histogram
+    except ImportError:
+        raise ConfigurationError(
+            "metrics=True requires the prometheus_client package "
+            "(pip install agentguard-zhx[metrics])"
+        ) from None
+    return Histogram(
+        "agentguard_http_request_duration_seconds",
+        "Duration of requests intercepted and proxied through AgentGuard",
+        ["pattern", "host", "method"],
+        buckets=_DURATION_BUCKETS
+    )
+
+
+class _FastJSONResponse(requests.Response):
+    """
+    ``requests.Response`` whose ``json()`` parses with orjson.
+
+    Bodies orjson rejects (non-UTF-8 encodings, invalid JSON) and calls with
+    keyword arguments fall back to requests' own parser, so error types and
+    messages are unchanged.
+    """
+
+    def json(self, **kwargs):
+        if not kwargs:
+            try:
+                return _json.loads(self.content)
+            except _json.JSONDecodeError:
+                pass
+        return super().json(**kwargs)
+
+
+def _use_fast_json(response: requests.Response) -> requests.Response:
+    """Make ``response.json()`` parse with orjson (see ``_FastJSONResponse``)."""
+    # Swapping the class keeps the response free of self-referencing closures;
+    # responses of other subclasses are left as they are
+    if type(response) is requests.Response:
+        response.__class__ = _FastJSONResponse
+    return response
+
+
+def _start_warm_up(send: Callable[[], requests.Response]) -> None:
+    """
+    Run a throwaway request in a daemon thread to open a pooled connection.
+
+    Best effort: failures are ignored, and the first real request then simply
+    connects as usual.
+    """
+    def warm_up():
+        try:
+            # Consuming the body releases the connection back to the pool
+            send().content
+        except requests.RequestException:
+            pass
+
+    threading.Thread(target=warm_up, name="agentguard-warm-up", daemon=True).start()
+
 
 class RequestsInterceptor:
     """Interceptor for requests library to route through AgentGuard"""
@@ -18,7 +179,9 @@ class RequestsInterceptor:
         self,
         agentguard_url: str,
         agent_api_key: str,
-        intercept_patterns: Optional[List[str]] = None
+        intercept_patterns: Optional[List[str]] = None,
+        intercept_engine: str = "re",
+        metrics: bool = False
     ):
         """
         Initialize requests interceptor.
@@ -27,12 +190,36 @@ class RequestsInterceptor:
             agentguard_url: AgentGuard server URL
             agent_api_key: AgentGuard API key
             intercept_patterns: List of URL patterns to intercept (regex)
+            intercept_engine: Regex engine used to match the patterns,
+                "re" (default) or "re2" (requires google-re2)
+            metrics: Whether to record intercepted request durations in the
+                ``agentguard_http_request_duration_seconds`` Prometheus
+                histogram (requires prometheus_client)
         """
         self.agentguard_url = agentguard_url.rstrip('/')
         self.agent_api_key = agent_api_key
+        self._proxy_url = f"{self.agentguard_url}/proxy/v1/api"
+
+        # 所有拦截的请求都发往同一个代理，复用 keep-alive 连接池；
+        # 连接失败时短暂退避重试（POST 请求不会在发出后被重放）
+        self._proxy_session = requests.Session()
+        self._proxy_session.mount(
+            f"{self.agentguard_url}/",
+            HTTPAdapter(
+                pool_connections=20,
+                pool_maxsize=100,
+                max_retries=Retry(total=3, backoff_factor=0.1)
+            )
+        )
+        compile_ = _regex_compiler(intercept_engine)
         self.intercept_patterns = [
-            re.compile(pattern) for pattern in (intercept_patterns or [])
+            compile_(pattern) for pattern in (intercept_patterns or [])
         ]
+        # 能安全合并时，所有模式合并成一个正则，每个请求只需一次 search 调用
+        self._combined_pattern = _compile_patterns(
+            tuple(intercept_patterns or ()), intercept_engine
+        )
+        self._duration_histogram = _request_duration_histogram() if metrics else None
 
     def should_intercept(self, url: str) -> bool:
         """
@@ -49,6 +236,8 @@ class RequestsInterceptor:
             return True
 
         # Check if URL matches any pattern
+        if self._combined_pattern is not None:
+            return self._combined_pattern.search(url) is not None
         return any(pattern.search(url) for pattern in self.intercept_patterns)
 
     def intercept_request(self, method: str, url: str, **kwargs):
@@ -66,31 +255,297 @@ class RequestsInterceptor:
         if not self.should_intercept(url):
             return _original_request(method, url, **kwargs)
 
+        started = time.perf_counter()
+        # 让 requests 把 params/auth/cookies 合并进 URL 和 headers（不含 body，
+        # body 由信封单独序列化）
+        prepared = requests.Request(
+            method=method,
+            url=url,
+            headers=kwargs.get('headers'),
+            params=kwargs.get('params'),
+            auth=kwargs.get('auth'),
+            cookies=kwargs.get('cookies')
+        ).prepare()
+        content = self._build_proxy_content(
+            method,
+            prepared.url,
+            prepared.headers,
+            json_body=kwargs.get('json'),
+            data=kwargs.get('data')
+        )
+
+        # Send request to AgentGuard proxy
+        response = self._proxy_session.post(
+            self._proxy_url,
+            data=content,
+            headers={'Content-Type': 'application/json'}
+        )
+        self._observe_duration(method, url, started)
+        return _use_fast_json(response)
+
+    def _observe_duration(self, method: str, url: str, started: float) -> None:
+        """
+        Record the duration of an intercepted request, if metrics are enabled.
+
+        Args:
+            method: HTTP method of the original request
+            url: Target URL of the original request
+            started: ``time.perf_counter()`` value when interception began
+        """
+        histogram = self._duration_histogram
+        if histogram is None:
+            return
+        elapsed = time.perf_counter() - started
+        # The combined regex doesn't tell which pattern matched, so find it
+        # here; this only runs when metrics are enabled
+        pattern = next(
+            (p.pattern for p in self.intercept_patterns if p.search(url)), "*"
+        )
+        # Without patterns every host is intercepted, so a per-host label
+        # would grow without bound
+        host = (urlsplit(url).hostname or "") if self.intercept_patterns else "*"
+        histogram.labels(
+            pattern=pattern,
+            host=host,
+            method=method.upper()
+        ).observe(elapsed)
+
+    def _build_proxy_content(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json_body: Any = None,
+        data: Any = None
+    ) -> bytes:
+        """
+        Build the JSON envelope sent to the AgentGuard proxy.
+
+        Args:
+            method: HTTP method of the original request
+            url: Target URL of the original request
+            headers: Headers of the original request
+            json_body: JSON body of the original request, if any
+            data: Raw body of the original request, if any
+
+        Returns:
+            UTF-8 JSON bytes of the proxy request
+
+        Raises:
+            AgentGuardError: If ``data`` is binary (not UTF-8 text)
+        """
         # Construct proxy request body
         proxy_body = {
             "apiKey": self.agent_api_key,
             "targetUrl": url,
             "method": method.upper(),
-            "headers": kwargs.get('headers', {}),
+            "headers": {
+                name: value for name, value in headers.items()
+                if name.lower() not in _HOP_BY_HOP_HEADERS
+            },
         }
 
         # Add request body if present
-        if 'json' in kwargs:
-            proxy_body['body'] = kwargs['json']
-        elif 'data' in kwargs:
+        if json_body is not None:
+            proxy_body['body'] = json_body
+        elif data is not None:
+            raw_body = self._raw_json_body(data)
+            if raw_body is not None:
+                # data 已经是 JSON 文本：直接拼进信封，省去一次 loads 和再次 dumps
+                return _json.dumps(proxy_body)[:-1] + b',"body":' + raw_body + b'}'
+            if isinstance(data, bytes):
+                try:
+                    data = data.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    # 信封是 JSON，二进制内容（如 files= 的 multipart 上传）无法无损携带
+                    raise AgentGuardError(
+                        f"Cannot proxy {method.upper()} {url} through AgentGuard: "
+                        f"the request body is not UTF-8 text (binary uploads are "
+                        f"not supported)"
+                    ) from e
             try:
-                proxy_body['body'] = json.loads(kwargs['data'])
+                proxy_body['body'] = json.loads(data)
             except (json.JSONDecodeError, TypeError):
-                proxy_body['body'] = kwargs['data']
+                proxy_body['body'] = data
 
-        # Send request to AgentGuard proxy
-        return _original_request(
-            'POST',
-            f"{self.agentguard_url}/proxy/v1/api",
-            json=proxy_body,
-            headers={'Content-Type': 'application/json'}
+        return _json.dumps(proxy_body)
+
+    def warm_up(self) -> None:
+        """Open a keep-alive connection to the AgentGuard proxy in the background."""
+        _start_warm_up(lambda: self._proxy_session.head(self._proxy_url, timeout=2))
+
+    def close(self) -> None:
+        """Close the pooled connections to the AgentGuard proxy."""
+        self._proxy_session.close()
+
+    @staticmethod
+    def _raw_json_body(data) -> Optional[bytes]:
+        """
+        Get ``data`` as bytes if it is a valid JSON object/array document.
+
+        Args:
+            data: The ``data`` argument of the intercepted request
+
+        Returns:
+            UTF-8 JSON bytes to embed verbatim, or None if ``data`` should be
+            handled as a regular value
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        elif not isinstance(data, bytes):
+            return None
+        if data.lstrip()[:1] not in (b'{', b'['):
+            return None
+        # 只有确认是合法 JSON 才能原样拼接，否则（如 "[INFO] ..."）按普通字符串处理
+        try:
+            _json.loads(data)
+        except _json.JSONDecodeError:
+            return None
+        return data
+
+
+class AgentGuardAdapter(HTTPAdapter):
+    """
+    requests transport adapter that routes matching requests through AgentGuard.
+
+    Mounted on a ``requests.Session`` (see ``enable_agentguard(session=...)``),
+    it intercepts only that session's traffic to the mounted URL prefixes;
+    requests to other prefixes use the session's regular adapters and never
+    enter AgentGuard code. Requests under a mounted prefix that don't match
+    the patterns are handed to the adapter that was mounted there before, so
+    the caller's own retry and pool settings still apply to them.
+    """
+
+    def __init__(
+        self,
+        interceptor: RequestsInterceptor,
+        fallbacks: Optional[Mapping[str, BaseAdapter]] = None,
+        **kwargs
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            interceptor: Interceptor deciding which URLs to route and how
+            fallbacks: Previously mounted adapters by URL prefix, used for
+                requests that aren't intercepted
+            **kwargs: Additional arguments passed to ``HTTPAdapter``
+        """
+        kwargs.setdefault("pool_connections", 20)
+        kwargs.setdefault("pool_maxsize", 100)
+        kwargs.setdefault("max_retries", Retry(total=3, backoff_factor=0.1))
+        super().__init__(**kwargs)
+        self.interceptor = interceptor
+        # Longest prefix first, matching how Session.get_adapter picks adapters
+        self._fallbacks = sorted(
+            (fallbacks or {}).items(), key=lambda item: len(item[0]), reverse=True
         )
 
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """
+        Send a request, rewriting it into an AgentGuard proxy call if it matches.
+
+        Args:
+            request: Prepared request
+            **kwargs: Additional arguments passed to ``HTTPAdapter.send``
+
+        Returns:
+            Response from AgentGuard proxy, or from the target for non-matching URLs
+        """
+        interceptor = self.interceptor
+        if interceptor.should_intercept(request.url):
+            started = time.perf_counter()
+            content = interceptor._build_proxy_content(
+                request.method,
+                request.url,
+                request.headers,
+                data=request.body
+            )
+            proxied = request.copy()
+            proxied.method = 'POST'
+            proxied.prepare_url(interceptor._proxy_url, None)
+            proxied.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+            proxied.prepare_body(content, None)
+            response = super().send(proxied, **kwargs)
+            interceptor._observe_duration(request.method, request.url, started)
+            return _use_fast_json(response)
+        fallback = self._fallback_for(request.url)
+        if fallback is not None:
+            return fallback.send(request, **kwargs)
+        return super().send(request, **kwargs)
+
+    def _fallback_for(self, url: str) -> Optional[BaseAdapter]:
+        lowered = url.lower()
+        for prefix, adapter in self._fallbacks:
+            if lowered.startswith(prefix.lower()):
+                return adapter
+        return None
+
+    def warm_up(self) -> None:
+        """Open a keep-alive connection to the AgentGuard proxy in the background."""
+        request = requests.Request('HEAD', self.interceptor._proxy_url).prepare()
+        # Send through HTTPAdapter.send directly: this request must not be intercepted
+        _start_warm_up(lambda: HTTPAdapter.send(self, request, timeout=2))
+
+    def close(self) -> None:
+        super().close()
+        for _, adapter in self._fallbacks:
+            adapter.close()
+        self.interceptor.close()
+
+
+def _literal_prefix(pattern: str) -> Optional[str]:
+    """
+    Get the literal URL prefix every match of ``pattern`` starts with.
+
+    Args:
+        pattern: URL pattern (regex)
+
+    Returns:
+        A ``scheme://host...`` prefix, or None if the pattern can't be reduced
+        to one (e.g. alternations or a non-literal scheme/host)
+    """
+    if '|' in pattern:
+        return None
+
+    chars = []
+    i = 1 if pattern.startswith('^') else 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            # Escaped punctuation is literal; classes like \d or \w are not
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                chars.append(pattern[i + 1])
+                i += 2
+                continue
+            break
+        if char in _REGEX_META:
+            # A quantifier makes the preceding character optional
+            if char in '*?{' and chars:
+                chars.pop()
+            break
+        chars.append(char)
+        i += 1
+
+    prefix = ''.join(chars)
+    scheme, sep, host = prefix.partition('://')
+    if not sep or scheme.lower() not in ('http', 'https') or not host:
+        return None
+    return prefix
+
+
+def _mount_prefixes(patterns: Optional[List[str]]) -> List[str]:
+    """
+    Get the URL prefixes to mount AgentGuardAdapter on for ``patterns``.
+
+    Falls back to all http:// and https:// URLs when any pattern has no
+    literal prefix; the adapter still checks every URL against the patterns.
+    """
+    prefixes = [_literal_prefix(pattern) for pattern in (patterns or [])]
+    if not prefixes or None in prefixes:
+        return ['http://', 'https://']
+    return list(dict.fromkeys(prefixes))
+
 
 # Global interceptor instance
 _interceptor: Optional[RequestsInterceptor] = None
@@ -99,14 +554,28 @@ _interceptor: Optional[RequestsInterceptor] = None
 def enable_agentguard(
     agentguard_url: str,
     agent_api_key: str,
-    intercept_patterns: Optional[List[str]] = None
+    intercept_patterns: Optional[List[str]] = None,
+    intercept_engine: str = "re",
+    session: Optional[requests.Session] = None,
+    warm_up: bool = True,
+    metrics: bool = False
 ) -> None:
     """
-    Enable global AgentGuard interception for requests library.
+    Enable AgentGuard interception for requests library.
 
-    This function monkey-patches the requests.request function to route
+    Without ``session``, this function monkey-patches the module-level
+    requests API (``requests.request``, ``requests.get``, ...) to route
     matching requests through AgentGuard proxy.
 
+    With ``session``, nothing is patched: an AgentGuardAdapter is mounted on
+    the session for the URL prefixes of the patterns (e.g.
+    ``https://api.example.com/`` for ``https://api\.example\.com/.*``), so
+    requests to other hosts carry no interception overhead at all. Patterns
+    without a literal ``scheme://host`` prefix (alternations, regex in the
+    host) make the adapter cover all http:// and https:// URLs instead, and
+    each URL is then checked against the patterns as usual; URLs that don't
+    match are sent through the adapter previously mounted for that prefix.
+
     Example:
         >>> from agentguard import enable_agentguard
         >>>
@@ -124,26 +593,68 @@ def enable_agentguard(
         agentguard_url: AgentGuard server URL
         agent_api_key: AgentGuard API key
         intercept_patterns: List of URL patterns to intercept (regex)
+        intercept_engine: Regex engine used to match the patterns, "re"
+            (default) or "re2" for linear-time matching of untrusted patterns
+            (requires ``pip install agentguard-zhx[re2]``)
+        session: Session to intercept instead of patching requests globally
+        warm_up: Whether to open a connection to the AgentGuard proxy in the
+            background right away, so the first intercepted call doesn't pay
+            for the TCP/TLS handshake
+        metrics: Whether to record intercepted request durations in the
+            ``agentguard_http_request_duration_seconds`` Prometheus histogram,
+            labelled by pattern, host and method (requires
+            ``pip install agentguard-zhx[metrics]``); expose it with
+            ``prometheus_client.start_http_server``
     """
-    global _interceptor
-
-    _interceptor = RequestsInterceptor(
+    interceptor = RequestsInterceptor(
         agentguard_url=agentguard_url,
         agent_api_key=agent_api_key,
-        intercept_patterns=intercept_patterns
+        intercept_patterns=intercept_patterns,
+        intercept_engine=intercept_engine,
+        metrics=metrics
     )
 
+    if session is not None:
+        prefixes = _mount_prefixes(intercept_patterns)
+        fallbacks = {}
+        for prefix in prefixes:
+            try:
+                fallbacks[prefix] = session.get_adapter(prefix)
+            except requests.exceptions.InvalidSchema:
+                pass
+        adapter = AgentGuardAdapter(interceptor, fallbacks=fallbacks)
+        for prefix in prefixes:
+            session.mount(prefix, adapter)
+        if warm_up:
+            adapter.warm_up()
+        return
+
+    global _interceptor
+
+    if _interceptor is not None:
+        _interceptor.close()
+
+    _interceptor = interceptor
+
     @wraps(_original_request)
     def wrapped_request(method, url, **kwargs):
         return _interceptor.intercept_request(method, url, **kwargs)
 
+    # requests.get/post/... call requests.api.request directly, so patch both
     requests.request = wrapped_request
+    requests.api.request = wrapped_request
+
+    if warm_up:
+        interceptor.warm_up()
 
 
 def disable_agentguard() -> None:
     """
-    Disable AgentGuard interception and restore original requests behavior.
+    Disable global AgentGuard interception and restore original requests behavior.
     """
     global _interceptor
+    if _interceptor is not None:
+        _interceptor.close()
     _interceptor = None
     requests.request = _original_request
+    requests.api.request = _original_request
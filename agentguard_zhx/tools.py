@@ -5,7 +5,52 @@ This allows business code to easily integrate AgentGuard approval tools.
 """
 
 from typing import Dict, Any, Callable, List
-import json
+
+from . import _json
+from .exceptions import AgentGuardError
+
+
+# 工具定义是固定的，模块加载时构造一次，避免每轮对话重复分配
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "submit_approval_reason",
+            "description": "提交审批申请理由。当需要执行高风险操作被 AgentGuard 拦截时，使用此工具提交申请理由。",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "approval_id": {
+                        "type": "string",
+                        "description": "审批请求ID（从拦截消息中获取）"
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "申请理由，需要详细说明为什么需要执行此操作"
+                    }
+                },
+                "required": ["approval_id", "reason"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "check_approval_status",
+            "description": "查询审批状态。当用户告知审批已通过时，使用此工具查询审批结果并获取执行结果。",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "approval_id": {
+                        "type": "string",
+                        "description": "审批请求ID"
+                    }
+                },
+                "required": ["approval_id"]
+            }
+        }
+    }
+]
 
 
 class AgentGuardTools:
@@ -24,49 +69,13 @@ class AgentGuardTools:
         """
         Get AgentGuard tool definitions for LLM function calling.
 
+        The definitions are built once at import time and shared; the returned
+        list is a fresh copy, but the definition dicts must not be mutated.
+
         Returns:
             List of tool definitions in OpenAI function calling format
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "submit_approval_reason",
-                    "description": "提交审批申请理由。当需要执行高风险操作被 AgentGuard 拦截时，使用此工具提交申请理由。",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "approval_id": {
-                                "type": "string",
-                                "description": "审批请求ID（从拦截消息中获取）"
-                            },
-                            "reason": {
-                                "type": "string",
-                                "description": "申请理由，需要详细说明为什么需要执行此操作"
-                            }
-                        },
-                        "required": ["approval_id", "reason"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_approval_status",
-                    "description": "查询审批状态。当用户告知审批已通过时，使用此工具查询审批结果并获取执行结果。",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "approval_id": {
-                                "type": "string",
-                                "description": "审批请求ID"
-                            }
-                        },
-                        "required": ["approval_id"]
-                    }
-                }
-            }
-        ]
+        return list(_TOOL_DEFINITIONS)
 
     def get_function_map(self) -> Dict[str, Callable]:
         """
@@ -92,19 +101,20 @@ class AgentGuardTools:
             Formatted result dictionary
         """
         try:
-            result = self.client.approvals.submit_reason(approval_id, reason)
-            return {
-                "success": True,
-                "message": "审批理由已提交，等待审批人员审核",
-                "approval_id": approval_id,
-                "reason": reason
-            }
-        except Exception as e:
+            self.client.approvals.submit_reason(approval_id, reason)
+        except AgentGuardError as e:
             return {
                 "success": False,
                 "message": f"提交审批理由失败: {str(e)}"
             }
 
+        return {
+            "success": True,
+            "message": "审批理由已提交，等待审批人员审核",
+            "approval_id": approval_id,
+            "reason": reason
+        }
+
     def _check_approval_status_wrapper(self, approval_id: str) -> Dict[str, Any]:
         """
         Wrapper for get_status that formats the response for LLM consumption.
@@ -176,21 +186,20 @@ class AgentGuardTools:
         Returns:
             Extracted text content
         """
-        # Handle different formats of execution results
-        if isinstance(execution_result, dict):
-            # OpenAI format: {"choices": [{"message": {"content": "..."}}]}
-            if "choices" in execution_result:
-                choices = execution_result.get("choices", [])
-                if choices and len(choices) > 0:
-                    message = choices[0].get("message", {})
-                    return message.get("content", "")
+        # OpenAI format: {"choices": [{"message": {"content": "..."}}]}
+        # 绝大多数执行结果都是这种格式，直接取值，失败再走其他分支
+        try:
+            return execution_result["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            pass
 
+        if isinstance(execution_result, dict):
             # Simplified format: {"content": "..."}
             if "content" in execution_result:
-                return execution_result.get("content", "")
+                return execution_result["content"]
 
             # Other formats: try to convert to JSON string
-            return json.dumps(execution_result, ensure_ascii=False, indent=2)
+            return _json.dumps(execution_result, indent=True).decode('utf-8')
 
         # If it's a string, return directly
         return str(execution_result)
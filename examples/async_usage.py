@@ -0,0 +1,59 @@
+"""
+Async usage example for AgentGuard Python SDK
+
+This example shows how to use AsyncAgentGuardOpenAI to send a batch of LLM
+API calls through AgentGuard concurrently. While one request waits (for the
+model, or for a human to approve it), the event loop keeps the others moving,
+so a single thread can have many requests in flight.
+"""
+
+import asyncio
+
+from agentguard_zhx import AsyncAgentGuardOpenAI
+
+# Initialize async AgentGuard OpenAI client
+client = AsyncAgentGuardOpenAI(
+    agentguard_url="http://localhost:8080",
+    agent_api_key="ag_xxx"  # Replace with your AgentGuard API key
+)
+
+questions = [
+    "What is AgentGuard?",
+    "Summarize last week's sales report.",
+    "Delete the inactive user accounts.",  # May require approval
+]
+
+
+async def ask(question: str):
+    return await client.chat.completions.create(
+        model="gpt-4",
+        messages=[
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": question}
+        ]
+    )
+
+
+async def main():
+    # All requests are sent concurrently over the same pooled connection
+    responses = await asyncio.gather(*[ask(question) for question in questions])
+
+    for question, response in zip(questions, responses):
+        print(f"Q: {question}")
+        print(f"A: {response.choices[0].message.content}\n")
+
+    # Approval statuses are looked up in one batch; the approval client is
+    # synchronous, so run it in a worker thread to keep the loop responsive
+    approval_ids = ["your_approval_id_here"]
+    loop = asyncio.get_running_loop()
+    statuses = await loop.run_in_executor(
+        None, client.approvals.get_statuses, approval_ids
+    )
+    for approval_id, status in statuses.items():
+        print(f"Approval {approval_id}: {status.status.value}")
+
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -23,8 +23,15 @@ enable_agentguard(
 # - Apply policies
 # - Track costs (if applicable)
 # - Require approval for high-risk operations
+#
+# Intercepted calls are sent over one pooled keep-alive session to the
+# AgentGuard proxy, so repeated calls reuse warm connections instead of
+# opening a new TCP/TLS connection each time.
 
 # Example: Call business API
+# Pass the body as json= as usual: for intercepted calls it is serialized once,
+# with orjson, straight into the AgentGuard proxy request, so there is no need
+# to pre-serialize it yourself.
 response = requests.post(
     "https://api.example.com/users",
     json={